@@ -24,6 +24,41 @@ def get_unique_values(column):
 players = get_unique_values("Player")
 years = get_unique_values("Year")
 events = get_unique_values("Event")
+leagues = get_unique_values("League")
+
+LEADERBOARD_PAGE_SIZE = 25
+
+# Leaderboard queries against the precomputed ranking tables
+LEADERBOARD_QUERIES = {
+    "totals": """
+        SELECT TotalRank AS Rank, RankedBy, Player, StatType, LeaderSeasonTotal, Best, LeaderCount,
+               FirstYear, LastYear
+        FROM leader_ranks
+        WHERE League = ? AND Event = ?
+        ORDER BY TotalRank, Player
+        LIMIT ? OFFSET ?
+    """,
+    "titles": """
+        SELECT LeaderRank AS Rank, Player, StatType, LeaderCount, FirstYear, LastYear
+        FROM leader_ranks
+        WHERE League = ? AND Event = ?
+        ORDER BY LeaderRank, Player
+        LIMIT ? OFFSET ?
+    """,
+    "seasons": """
+        SELECT SeasonRank AS Rank, Year, Player, Team, Value
+        FROM season_ranks
+        WHERE League = ? AND Event = ?
+        ORDER BY SeasonRank, Year
+        LIMIT ? OFFSET ?
+    """,
+}
+
+LEADERBOARD_COUNT_QUERIES = {
+    "totals": "SELECT COUNT(*) FROM leader_ranks WHERE League = ? AND Event = ?",
+    "titles": "SELECT COUNT(*) FROM leader_ranks WHERE League = ? AND Event = ?",
+    "seasons": "SELECT COUNT(*) FROM season_ranks WHERE League = ? AND Event = ?",
+}
 
 # Initialize Dash app
 app = dash.Dash(__name__)
@@ -41,17 +76,22 @@ app.layout = html.Div([
     html.Div([
         html.Label("Player"),
         dcc.Dropdown(options=[{"label": p, "value": p} for p in players], id="player-filter", placeholder="Select player"),
-    ], style={"width": "30%", "display": "inline-block", "padding": "10px"}),
+    ], style={"width": "25%", "display": "inline-block", "padding": "10px"}),
+
+    html.Div([
+        html.Label("League"),
+        dcc.Dropdown(options=[{"label": l, "value": l} for l in leagues], id="league-filter", placeholder="Select league"),
+    ], style={"width": "10%", "display": "inline-block", "padding": "10px"}),
 
     html.Div([
         html.Label("Year"),
         dcc.Dropdown(options=[{"label": y, "value": y} for y in years], id="year-filter", placeholder="Select year"),
-    ], style={"width": "20%", "display": "inline-block", "padding": "10px"}),
+    ], style={"width": "15%", "display": "inline-block", "padding": "10px"}),
 
     html.Div([
         html.Label("Event"),
         dcc.Dropdown(options=[{"label": e, "value": e} for e in events], id="event-filter", placeholder="Select event"),
-    ], style={"width": "30%", "display": "inline-block", "padding": "10px"}),
+    ], style={"width": "25%", "display": "inline-block", "padding": "10px"}),
 
 
     html.Div([
@@ -105,6 +145,61 @@ app.layout = html.Div([
 
     html.Hr(),
 
+    html.Div([
+        html.H3("\U0001f3c6 Leaderboards"),
+
+        html.Div([
+            html.Label("Event"),
+            dcc.Dropdown(
+                options=[{"label": e, "value": e} for e in events],
+                value="Home Runs",
+                id="leaderboard-event",
+                clearable=False
+            ),
+        ], style={"width": "30%", "display": "inline-block", "padding": "10px"}),
+
+        html.Div([
+            html.Label("League"),
+            dcc.Dropdown(
+                options=[{"label": "All leagues (MLB)", "value": "MLB"}]
+                + [{"label": l, "value": l} for l in leagues],
+                value="MLB",
+                id="leaderboard-league",
+                clearable=False
+            ),
+        ], style={"width": "15%", "display": "inline-block", "padding": "10px"}),
+
+        html.Div([
+            html.Label("Leaderboard"),
+            dcc.Dropdown(
+                id="leaderboard-type",
+                options=[
+                    {"label": "Totals from league-leading seasons", "value": "totals"},
+                    {"label": "Most times leading", "value": "titles"},
+                    {"label": "Best league-leading seasons", "value": "seasons"},
+                ],
+                value="totals",
+                clearable=False
+            ),
+        ], style={"width": "30%", "display": "inline-block", "padding": "10px"}),
+
+        dash_table.DataTable(
+            id="leaderboard-table",
+            page_current=0,
+            page_size=LEADERBOARD_PAGE_SIZE,
+            page_action="custom",
+            style_table={'overflowX': 'auto'}
+        ),
+        html.P(
+            "Leaderboards are read page by page from ranking tables built during import. "
+            "The data holds only each year's league leaders, so totals cover league-leading "
+            "seasons, not full careers, and rate stats are ranked by best season.",
+            style={"textAlign": "center", "fontStyle": "italic", "color": "gray", "marginTop": "5px"}
+        )
+    ], style={"marginBottom": "30px"}),
+
+    html.Hr(),
+
     html.Div([
         html.H3("About This Dashboard"),
         html.P(
@@ -130,17 +225,21 @@ app.layout = html.Div([
     Output("pie-chart", "figure"),
     Output("scatter-plot", "figure"),
     Input("player-filter", "value"),
+    Input("league-filter", "value"),
     Input("year-filter", "value"),
     Input("event-filter", "value"),
     Input("type-filter", "value")
 )
-def update_dashboard(player, year, event, stat_type):
+def update_dashboard(player, league, year, event, stat_type):
     filters = []
     params = []
 
     if player:
         filters.append("Player = ?")
         params.append(player)
+    if league:
+        filters.append("League = ?")
+        params.append(league)
     if year:
         filters.append("Year = ?")
         params.append(year)
@@ -151,12 +250,12 @@ def update_dashboard(player, year, event, stat_type):
     where_clause = "WHERE " + " AND ".join(filters) if filters else ""
 
     hitting_query = """
-        SELECT h.Year, h.Event, h.Player, h.Team, h.Value, e.Description
+        SELECT h.Year, h.League, h.Event, h.Player, h.Team, h.Value, e.Description
         FROM hitting_stats h
         LEFT JOIN events e ON h.Event = e.Event
     """
     pitching_query = """
-        SELECT p.Year, p.Event, p.Player, p.Team, p.Value, e.Description
+        SELECT p.Year, p.League, p.Event, p.Player, p.Team, p.Value, e.Description
         FROM pitching_stats p
         LEFT JOIN events e ON p.Event = e.Event
     """
@@ -230,6 +329,40 @@ def update_dashboard(player, year, event, stat_type):
 
     return kpi_cards, data, columns, bar_fig, line_fig, pie_fig, scatter_fig
 
+@app.callback(
+    Output("leaderboard-table", "page_current"),
+    Input("leaderboard-league", "value"),
+    Input("leaderboard-event", "value"),
+    Input("leaderboard-type", "value")
+)
+def reset_leaderboard_page(league, event, board):
+    return 0
+
+@app.callback(
+    Output("leaderboard-table", "data"),
+    Output("leaderboard-table", "columns"),
+    Output("leaderboard-table", "page_count"),
+    Input("leaderboard-league", "value"),
+    Input("leaderboard-event", "value"),
+    Input("leaderboard-type", "value"),
+    Input("leaderboard-table", "page_current"),
+    Input("leaderboard-table", "page_size")
+)
+def update_leaderboard(league, event, board, page_current, page_size):
+    if not league or not event or board not in LEADERBOARD_QUERIES:
+        return [], [], 0
+
+    offset = (page_current or 0) * page_size
+
+    with sqlite3.connect(DB_PATH) as conn:
+        df = pd.read_sql_query(LEADERBOARD_QUERIES[board], conn, params=[league, event, page_size, offset])
+        total_rows = conn.execute(LEADERBOARD_COUNT_QUERIES[board], (league, event)).fetchone()[0]
+
+    columns = [{"name": i, "id": i} for i in df.columns]
+    page_count = max(1, -(-total_rows // page_size))
+
+    return df.to_dict("records"), columns, page_count
+
 if __name__ == "__main__":
     app.run(debug=True)
 
@@ -19,102 +19,245 @@ def print_results(rows, headers):
     for row in rows:
         print("\t".join(str(item) if item is not None else "" for item in row))
 
-def search_by_player(conn, player_name):
+def league_condition(league):
+    # Filtering on League lets SQLite seek the (League, ...) indexes
+    if not league:
+        return "", ()
+    return " AND League = ?", (league,)
+
+def search_by_player(conn, player_name, league=None):
+    league_filter, league_params = league_condition(league)
+
     print(f"\n--- Hitting Stats for player '{player_name}' ---")
-    query = """
-        SELECT h.Year, h.Event, h.Player, h.Team, h.Value, e.Description
+    query = f"""
+        SELECT h.Year, h.League, h.Event, h.Player, h.Team, h.Value, e.Description
         FROM hitting_stats h
         LEFT JOIN events e ON h.Event = e.Event
-        WHERE h.Player LIKE ?
+        WHERE h.Player LIKE ?{league_filter}
         ORDER BY h.Year
     """
     try:
         cur = conn.cursor()
-        cur.execute(query, (f"%{player_name}%",))
+        cur.execute(query, (f"%{player_name}%", *league_params))
         rows = cur.fetchall()
-        print_results(rows, ["Year", "Event", "Player", "Team", "Value", "Description"])
+        print_results(rows, ["Year", "League", "Event", "Player", "Team", "Value", "Description"])
     except sqlite3.Error as e:
         print(f"Query error: {e}")
 
     print(f"\n--- Pitching Stats for player '{player_name}' ---")
-    query = """
-        SELECT p.Year, p.Event, p.Player, p.Team, p.Value, e.Description
+    query = f"""
+        SELECT p.Year, p.League, p.Event, p.Player, p.Team, p.Value, e.Description
         FROM pitching_stats p
         LEFT JOIN events e ON p.Event = e.Event
-        WHERE p.Player LIKE ?
+        WHERE p.Player LIKE ?{league_filter}
         ORDER BY p.Year
     """
     try:
-        cur.execute(query, (f"%{player_name}%",))
+        cur.execute(query, (f"%{player_name}%", *league_params))
         rows = cur.fetchall()
-        print_results(rows, ["Year", "Event", "Player", "Team", "Value", "Description"])
+        print_results(rows, ["Year", "League", "Event", "Player", "Team", "Value", "Description"])
     except sqlite3.Error as e:
         print(f"Query error: {e}")
 
-def search_by_year(conn, year):
+def search_by_year(conn, year, league=None):
+    league_filter, league_params = league_condition(league)
+
     print(f"\n--- Hitting Stats for year {year} ---")
-    query = """
-        SELECT h.Year, h.Event, h.Player, h.Team, h.Value, e.Description
+    query = f"""
+        SELECT h.Year, h.League, h.Event, h.Player, h.Team, h.Value, e.Description
         FROM hitting_stats h
         LEFT JOIN events e ON h.Event = e.Event
-        WHERE h.Year = ?
+        WHERE h.Year = ?{league_filter}
         ORDER BY h.Player
     """
     try:
         cur = conn.cursor()
-        cur.execute(query, (year,))
+        cur.execute(query, (year, *league_params))
         rows = cur.fetchall()
-        print_results(rows, ["Year", "Event", "Player", "Team", "Value", "Description"])
+        print_results(rows, ["Year", "League", "Event", "Player", "Team", "Value", "Description"])
     except sqlite3.Error as e:
         print(f"Query error: {e}")
 
     print(f"\n--- Pitching Stats for year {year} ---")
-    query = """
-        SELECT p.Year, p.Event, p.Player, p.Team, p.Value, e.Description
+    query = f"""
+        SELECT p.Year, p.League, p.Event, p.Player, p.Team, p.Value, e.Description
         FROM pitching_stats p
         LEFT JOIN events e ON p.Event = e.Event
-        WHERE p.Year = ?
+        WHERE p.Year = ?{league_filter}
         ORDER BY p.Player
     """
     try:
-        cur.execute(query, (year,))
+        cur.execute(query, (year, *league_params))
         rows = cur.fetchall()
-        print_results(rows, ["Year", "Event", "Player", "Team", "Value", "Description"])
+        print_results(rows, ["Year", "League", "Event", "Player", "Team", "Value", "Description"])
     except sqlite3.Error as e:
         print(f"Query error: {e}")
 
-def search_by_event(conn, event):
+def search_by_event(conn, event, league=None):
+    league_filter, league_params = league_condition(league)
+
     print(f"\n--- Hitting Stats for event '{event}' ---")
-    query = """
-        SELECT h.Year, h.Event, h.Player, h.Team, h.Value, e.Description
+    query = f"""
+        SELECT h.Year, h.League, h.Event, h.Player, h.Team, h.Value, e.Description
         FROM hitting_stats h
         LEFT JOIN events e ON h.Event = e.Event
-        WHERE h.Event LIKE ?
+        WHERE h.Event LIKE ?{league_filter}
         ORDER BY h.Year, h.Player
     """
     try:
         cur = conn.cursor()
-        cur.execute(query, (f"%{event}%",))
+        cur.execute(query, (f"%{event}%", *league_params))
         rows = cur.fetchall()
-        print_results(rows, ["Year", "Event", "Player", "Team", "Value", "Description"])
+        print_results(rows, ["Year", "League", "Event", "Player", "Team", "Value", "Description"])
     except sqlite3.Error as e:
         print(f"Query error: {e}")
 
     print(f"\n--- Pitching Stats for event '{event}' ---")
-    query = """
-        SELECT p.Year, p.Event, p.Player, p.Team, p.Value, e.Description
+    query = f"""
+        SELECT p.Year, p.League, p.Event, p.Player, p.Team, p.Value, e.Description
         FROM pitching_stats p
         LEFT JOIN events e ON p.Event = e.Event
-        WHERE p.Event LIKE ?
+        WHERE p.Event LIKE ?{league_filter}
         ORDER BY p.Year, p.Player
     """
     try:
-        cur.execute(query, (f"%{event}%",))
+        cur.execute(query, (f"%{event}%", *league_params))
+        rows = cur.fetchall()
+        print_results(rows, ["Year", "League", "Event", "Player", "Team", "Value", "Description"])
+    except sqlite3.Error as e:
+        print(f"Query error: {e}")
+
+def leaderboard_totals(conn, event, league="MLB", limit=25, page=1):
+    print(f"\n--- Totals from League-Leading Seasons in '{event}' in {league} (page {page}) ---")
+    query = """
+        SELECT TotalRank, RankedBy, Player, StatType, LeaderSeasonTotal, Best, LeaderCount, FirstYear, LastYear
+        FROM leader_ranks
+        WHERE League = ? AND Event = ?
+        ORDER BY TotalRank, Player
+        LIMIT ? OFFSET ?
+    """
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (league, event, limit, (page - 1) * limit))
         rows = cur.fetchall()
-        print_results(rows, ["Year", "Event", "Player", "Team", "Value", "Description"])
+        print_results(rows, ["Rank", "Ranked By", "Player", "Type", "Leading Total", "Best", "Titles", "First", "Last"])
     except sqlite3.Error as e:
         print(f"Query error: {e}")
 
+def leaderboard_titles(conn, event, league="MLB", limit=25, page=1):
+    print(f"\n--- Most Times Leading '{event}' in {league} (page {page}) ---")
+    query = """
+        SELECT LeaderRank, Player, StatType, LeaderCount, FirstYear, LastYear
+        FROM leader_ranks
+        WHERE League = ? AND Event = ?
+        ORDER BY LeaderRank, Player
+        LIMIT ? OFFSET ?
+    """
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (league, event, limit, (page - 1) * limit))
+        rows = cur.fetchall()
+        print_results(rows, ["Rank", "Player", "Type", "Titles", "First", "Last"])
+    except sqlite3.Error as e:
+        print(f"Query error: {e}")
+
+def leaderboard_seasons(conn, event, league="MLB", limit=25, page=1):
+    print(f"\n--- Best League-Leading Seasons in '{event}' in {league} (page {page}) ---")
+    query = """
+        SELECT SeasonRank, Year, Player, Team, Value
+        FROM season_ranks
+        WHERE League = ? AND Event = ?
+        ORDER BY SeasonRank, Year
+        LIMIT ? OFFSET ?
+    """
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (league, event, limit, (page - 1) * limit))
+        rows = cur.fetchall()
+        print_results(rows, ["Rank", "Year", "Player", "Team", "Value"])
+    except sqlite3.Error as e:
+        print(f"Query error: {e}")
+
+def player_event_ranks(conn, player_name, event, league="MLB"):
+    league_filter, league_params = league_condition(league)
+
+    print(f"\n--- Season Ranks for player '{player_name}' in '{event}' ---")
+    query = f"""
+        SELECT Year, League, Player, Team, Value, SeasonRank
+        FROM season_ranks
+        WHERE Player LIKE ? AND Event = ?{league_filter}
+        ORDER BY Year
+    """
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (f"%{player_name}%", event, *league_params))
+        rows = cur.fetchall()
+        print_results(rows, ["Year", "League", "Player", "Team", "Value", "Rank"])
+    except sqlite3.Error as e:
+        print(f"Query error: {e}")
+
+    print(f"\n--- Leader Rank for player '{player_name}' in '{event}' ---")
+    query = f"""
+        SELECT League, Player, LeaderSeasonTotal, Best, LeaderCount, TotalRank, RankedBy, LeaderRank
+        FROM leader_ranks
+        WHERE Player LIKE ? AND Event = ?{league_filter}
+        ORDER BY League, TotalRank
+    """
+    try:
+        cur.execute(query, (f"%{player_name}%", event, *league_params))
+        rows = cur.fetchall()
+        print_results(rows, ["League", "Player", "Leading Total", "Best", "Titles", "Rank", "Ranked By", "Titles Rank"])
+    except sqlite3.Error as e:
+        print(f"Query error: {e}")
+
+def prompt_league(default=None, choices=("AL", "NL")):
+    hint = f"[{default}]" if default else "[all]"
+    league = input(f"League ({', '.join(choices)}) {hint}: ").strip().upper()
+    if league in choices:
+        return league
+    if league:
+        print(f"Unknown league '{league}', using {default or 'all leagues'}.")
+    return default
+
+def leaderboard_menu(conn):
+    print("\n🏆 Leaderboards")
+    print("Note: the data holds only each year's league leaders, not full careers.")
+    print("1. Totals from league-leading seasons")
+    print("2. Most times leading an event")
+    print("3. Best league-leading seasons")
+    print("4. Rank of a player in an event")
+
+    choice = input("Choose a leaderboard: ").strip()
+    if choice not in ("1", "2", "3", "4"):
+        print("Invalid choice.")
+        return
+
+    event = input("Enter exact event name (e.g., Home Runs, ERA): ").strip()
+    if not event:
+        print("Event cannot be empty.")
+        return
+
+    if choice == "4":
+        name = input("Enter player name: ").strip()
+        if name:
+            player_event_ranks(conn, name, event, prompt_league("MLB", ("MLB", "AL", "NL")))
+        else:
+            print("Player name cannot be empty.")
+        return
+
+    league = prompt_league("MLB", ("MLB", "AL", "NL"))
+    limit = input("Rows per page [25]: ").strip()
+    page = input("Page [1]: ").strip()
+    limit = int(limit) if limit.isdigit() and int(limit) > 0 else 25
+    page = int(page) if page.isdigit() and int(page) > 0 else 1
+
+    if choice == "1":
+        leaderboard_totals(conn, event, league, limit, page)
+    elif choice == "2":
+        leaderboard_titles(conn, event, league, limit, page)
+    else:
+        leaderboard_seasons(conn, event, league, limit, page)
+
 def main():
     db_path = os.path.join(os.path.dirname(__file__), "..", "data", "mlb_stats.db")
     db_path = os.path.abspath(db_path)
@@ -128,6 +271,7 @@ def main():
         print("1. Search by player name")
         print("2. Search by year")
         print("3. Search by event")
+        print("4. Leaderboards")
         print("0. Exit")
 
         choice = input("Choose an option: ").strip()
@@ -135,21 +279,23 @@ def main():
         if choice == "1":
             name = input("Enter player name: ").strip()
             if name:
-                search_by_player(conn, name)
+                search_by_player(conn, name, prompt_league())
             else:
                 print("Player name cannot be empty.")
         elif choice == "2":
             year = input("Enter year (e.g., 2012): ").strip()
             if year.isdigit():
-                search_by_year(conn, int(year))
+                search_by_year(conn, int(year), prompt_league())
             else:
                 print("Invalid year.")
         elif choice == "3":
             event = input("Enter event (e.g., Home Runs, ERA): ").strip()
             if event:
-                search_by_event(conn, event)
+                search_by_event(conn, event, prompt_league())
             else:
                 print("Event cannot be empty.")
+        elif choice == "4":
+            leaderboard_menu(conn)
         elif choice == "0":
             print("Exiting program.")
             break
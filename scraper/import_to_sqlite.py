@@ -1,7 +1,39 @@
 import sqlite3
 import csv
 import os
+import shutil
+import tempfile
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from leagues import LEAGUES, league_csv_paths
+
+# Events where a lower value is the better result (e.g. ERA)
+LOWER_IS_BETTER_EVENTS = ("ERA",)
+
+# Rate stats: summing seasons means nothing, so players are ranked by their best season
+RATE_EVENTS = (
+    "Batting Average",
+    "ERA",
+    "On Base Percentage",
+    "Slugging Average",
+    "Winning Percentage",
+)
+
+# Scraped CSV files per league and stat type, named the same way scraper.py writes them
+STAT_SOURCES = [
+    (league, stat_type, csv_path)
+    for league in LEAGUES
+    for stat_type, csv_path in league_csv_paths(league).items()
+]
+
+STAT_COLUMNS_TYPES = [
+    "Year INTEGER",
+    "League TEXT",
+    "Event TEXT",
+    "Player TEXT",
+    "Team TEXT",
+    "Value REAL"
+]
 
 def create_connection(db_file):
     try:
@@ -12,6 +44,24 @@ def create_connection(db_file):
         print(f"❌ Error connecting to database: {e}")
         return None
 
+def clean_stats(df):
+    # Count how many duplicates were found (compare with length)
+    num_duplicates_removed = df.shape[0] - df.drop_duplicates().shape[0]
+    df = df.drop_duplicates()
+
+    # Count rows with missing values in key columns before removal
+    num_na_removed = df[["Player", "Event", "Value"]].isna().any(axis=1).sum()
+    df = df.dropna(subset=["Player", "Event", "Value"])
+
+    if "Value" in df.columns:
+        df = df.assign(Value=pd.to_numeric(df["Value"], errors="coerce"))
+
+        na_after_value_conversion = df["Value"].isna().sum()
+        num_na_removed += na_after_value_conversion
+        df = df.dropna(subset=["Value"])
+
+    return df, num_duplicates_removed, num_na_removed
+
 def import_csv_to_table(conn, csv_path, table_name, columns_types, clean_data=True):
     if not os.path.exists(csv_path):
         print(f"⚠️ File not found: {csv_path}")
@@ -25,20 +75,7 @@ def import_csv_to_table(conn, csv_path, table_name, columns_types, clean_data=Tr
         print(df.head())
 
         if clean_data:
-            # Count how many duplicates were found (compare with length)
-            num_duplicates_removed = df.shape[0] - df.drop_duplicates().shape[0]
-            df.drop_duplicates(inplace=True)
-
-            # Count rows with missing values in key columns before removal
-            num_na_removed = df[["Player", "Event", "Value"]].isna().any(axis=1).sum()
-            df.dropna(subset=["Player", "Event", "Value"], inplace=True)
-
-            if "Value" in df.columns:
-                df["Value"] = pd.to_numeric(df["Value"], errors="coerce")
-
-                na_after_value_conversion = df["Value"].isna().sum()
-                num_na_removed += na_after_value_conversion
-                df.dropna(subset=["Value"], inplace=True)
+            df, num_duplicates_removed, num_na_removed = clean_stats(df)
 
             print(f"Duplicates removed: {num_duplicates_removed}")
             print(f"Removed rows with missing values: {num_na_removed}")
@@ -77,38 +114,195 @@ def import_csv_to_table(conn, csv_path, table_name, columns_types, clean_data=Tr
     except Exception as e:
         print(f"❌ Error processing {csv_path}: {e}")
 
+def plan_partitions(stat_sources, partition_dir):
+    work_items = []
+
+    for league, stat_type, csv_path in stat_sources:
+        if not os.path.exists(csv_path):
+            print(f"⚠️ File not found: {csv_path}")
+            continue
+
+        work_items.append((league, stat_type, csv_path, partition_dir))
+
+    return work_items
+
+def clean_partition(work_item):
+    league, stat_type, csv_path, partition_dir = work_item
+
+    try:
+        # Each file is read once; its decades become separate partition databases
+        df = pd.read_csv(csv_path)
+        df.insert(1, "League", league)
+
+        years = pd.to_numeric(df["Year"], errors="coerce")
+        num_bad_years = int(years.isna().sum())
+        df = df[years.notna()].assign(Year=years.dropna().astype(int))
+
+        results = []
+        for decade, part in df.groupby(df["Year"] // 10 * 10):
+            part, num_duplicates_removed, num_na_removed = clean_stats(part)
+
+            # Rows without a valid year are reported with the file's first decade
+            num_na_removed += num_bad_years
+            num_bad_years = 0
+
+            partition_path = os.path.join(partition_dir, f"{league}_{stat_type}_{decade}s.db")
+            with sqlite3.connect(partition_path) as conn:
+                conn.execute(f"CREATE TABLE stats ({', '.join(STAT_COLUMNS_TYPES)})")
+                placeholders = ", ".join(["?" for _ in STAT_COLUMNS_TYPES])
+                conn.executemany(
+                    f"INSERT INTO stats VALUES ({placeholders})",
+                    part.sort_values("Year").itertuples(index=False, name=None)
+                )
+            conn.close()
+
+            results.append(
+                (league, stat_type, int(decade), partition_path, len(part),
+                 num_duplicates_removed, num_na_removed, None)
+            )
+
+        return results
+
+    except Exception as e:
+        return [(league, stat_type, 0, None, 0, 0, 0, f"{csv_path}: {e}")]
+
+def import_stat_partitions(conn, stat_sources, workers=None):
+    partition_dir = tempfile.mkdtemp(prefix="mlb_partitions_")
+
+    try:
+        work_items = plan_partitions(stat_sources, partition_dir)
+        print(f"\n🧩 Splitting {len(work_items)} league/stat-type files into decade partitions in parallel...")
+
+        # Each worker reads one file, then cleans and writes its decade partition databases
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [r for file_results in executor.map(clean_partition, work_items) for r in file_results]
+
+        # Existing tables are only replaced once every file has been cleaned successfully
+        errors = [r[-1] for r in results if r[-1]]
+        for error in errors:
+            print(f"❌ Error processing {error}")
+        if errors or not results:
+            print("❌ No partitions imported; existing stat tables were left unchanged.")
+            return False
+
+        cur = conn.cursor()
+        for table_name in ("hitting_stats", "pitching_stats"):
+            cur.execute(f"DROP TABLE IF EXISTS {table_name}")
+            cur.execute(f"CREATE TABLE {table_name} ({', '.join(STAT_COLUMNS_TYPES)})")
+        conn.commit()
+
+        # Merge partitions in (League, Year) order so rows are stored clustered by league and decade
+        for league, stat_type, decade, partition_path, row_count, num_duplicates, num_na, _ in sorted(
+            results, key=lambda r: r[:3]
+        ):
+            cur.execute("ATTACH DATABASE ? AS part", (partition_path,))
+            cur.execute(f"INSERT INTO {stat_type}_stats SELECT * FROM part.stats")
+            conn.commit()
+            cur.execute("DETACH DATABASE part")
+            print(
+                f"✅ {league} {stat_type} {decade}s: imported {row_count} rows "
+                f"(duplicates removed: {num_duplicates}, missing values removed: {num_na})"
+            )
+
+        # Indexes let queries filtered by league and year skip other partitions
+        for table_name in ("hitting_stats", "pitching_stats"):
+            cur.execute(f"CREATE INDEX idx_{table_name}_league_year ON {table_name} (League, Year)")
+            cur.execute(f"CREATE INDEX idx_{table_name}_league_event ON {table_name} (League, Event, Year)")
+            # Searches across all leagues filter on Year alone
+            cur.execute(f"CREATE INDEX idx_{table_name}_year ON {table_name} (Year)")
+
+        conn.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ Error loading partitions: {e}")
+        return False
+
+    finally:
+        shutil.rmtree(partition_dir, ignore_errors=True)
+
+def build_ranking_tables(conn):
+    lower_events = ", ".join(f"'{e}'" for e in LOWER_IS_BETTER_EVENTS)
+    rate_events = ", ".join(f"'{e}'" for e in RATE_EVENTS)
+
+    # Sort key where a smaller number is always better, whatever the event
+    score = f"CASE WHEN Event IN ({lower_events}) THEN Value ELSE -Value END"
+
+    all_stats = """
+        SELECT 'hitting' AS StatType, League, Year, Event, Player, Team, Value FROM hitting_stats
+        UNION ALL
+        SELECT 'pitching' AS StatType, League, Year, Event, Player, Team, Value FROM pitching_stats
+    """
+
+    # Each league is ranked on its own, plus once more across all leagues as 'MLB'
+    ranked_stats = f"""
+        {all_stats}
+        UNION ALL
+        SELECT StatType, 'MLB' AS League, Year, Event, Player, Team, Value FROM ({all_stats})
+    """
+
+    try:
+        print("\n🏆 Building ranking tables...")
+        cur = conn.cursor()
+
+        # The scraped pages list only each year's league leader(s), so these are
+        # league-leading seasons ranked against each other, not every season played
+        cur.execute("DROP TABLE IF EXISTS season_ranks")
+        cur.execute(f"""
+            CREATE TABLE season_ranks AS
+            SELECT StatType, League, Event, Year, Player, Team, Value,
+                   RANK() OVER (PARTITION BY League, Event ORDER BY {score}) AS SeasonRank
+            FROM ({ranked_stats})
+        """)
+        cur.execute("CREATE INDEX idx_season_ranks_event_rank ON season_ranks (League, Event, SeasonRank, Year)")
+        cur.execute("CREATE INDEX idx_season_ranks_player ON season_ranks (Player, Event, League, Year)")
+
+        # Per player, league and event: totals over league-leading seasons only (not career
+        # totals, which would need full per-player season data), best season and times led
+        cur.execute("DROP TABLE IF EXISTS career_ranks")
+        cur.execute("DROP TABLE IF EXISTS leader_ranks")
+        cur.execute(f"""
+            CREATE TABLE leader_ranks AS
+            SELECT StatType, League, Event, Player, LeaderSeasonTotal, Best, LeaderCount, FirstYear, LastYear,
+                   CASE WHEN Event IN ({rate_events}) THEN 'best season' ELSE 'total' END AS RankedBy,
+                   RANK() OVER (
+                       PARTITION BY League, Event
+                       ORDER BY CASE WHEN Event IN ({rate_events}) THEN BestScore ELSE -LeaderSeasonTotal END
+                   ) AS TotalRank,
+                   RANK() OVER (PARTITION BY League, Event ORDER BY LeaderCount DESC) AS LeaderRank
+            FROM (
+                SELECT StatType, League, Event, Player,
+                       CASE WHEN Event IN ({rate_events}) THEN NULL ELSE SUM(Value) END AS LeaderSeasonTotal,
+                       CASE WHEN Event IN ({lower_events}) THEN MIN(Value) ELSE MAX(Value) END AS Best,
+                       MIN({score}) AS BestScore,
+                       COUNT(DISTINCT Year) AS LeaderCount,
+                       MIN(Year) AS FirstYear,
+                       MAX(Year) AS LastYear
+                FROM ({ranked_stats})
+                GROUP BY StatType, League, Event, Player
+            )
+        """)
+        cur.execute("CREATE INDEX idx_leader_ranks_event_rank ON leader_ranks (League, Event, TotalRank, Player)")
+        cur.execute("CREATE INDEX idx_leader_ranks_event_leader ON leader_ranks (League, Event, LeaderRank, Player)")
+        cur.execute("CREATE INDEX idx_leader_ranks_player ON leader_ranks (Player, Event, League)")
+
+        conn.commit()
+        season_count = cur.execute("SELECT COUNT(*) FROM season_ranks").fetchone()[0]
+        leader_count = cur.execute("SELECT COUNT(*) FROM leader_ranks").fetchone()[0]
+        print(f"✅ Ranked {season_count} league-leading seasons and {leader_count} player/event leaders")
+
+    except sqlite3.Error as e:
+        print(f"❌ Error building ranking tables: {e}")
+
 def main():
     db_path = "../data/mlb_stats.db"
     conn = create_connection(db_path)
 
     if conn:
-        import_csv_to_table(
-            conn,
-            "../data/american_league_stats_1901_2024.csv",
-            "hitting_stats",
-            [
-                "Year INTEGER",
-                "Event TEXT",
-                "Player TEXT",
-                "Team TEXT",
-                "Value REAL"
-            ],
-            clean_data=True
-        )
-
-        import_csv_to_table(
-            conn,
-            "../data/american_league_pitcher_stats_1901_2024.csv",
-            "pitching_stats",
-            [
-                "Year INTEGER",
-                "Event TEXT",
-                "Player TEXT",
-                "Team TEXT",
-                "Value REAL"
-            ],
-            clean_data=True
-        )
+        if not import_stat_partitions(conn, STAT_SOURCES):
+            conn.close()
+            print("\n❌ Import failed; ranking tables were not rebuilt.")
+            return
 
         import_csv_to_table(
             conn,
@@ -121,6 +315,12 @@ def main():
             clean_data=False  # No cleaning needed for mlb_events
         )
 
+        build_ranking_tables(conn)
+
+        # Statistics let the planner pick indexes (and skip-scan League) for every filter
+        conn.execute("ANALYZE")
+        conn.commit()
+
         conn.close()
         print("\n✅ Import completed and connection closed.")
 
@@ -0,0 +1,18 @@
+# Shared by scraper.py and import_to_sqlite.py so CSV names and seasons stay in sync
+
+# League code -> page suffix, name used in page headers, first season on the site
+LEAGUES = {
+    "AL": {"suffix": "a", "name": "American League", "first_year": 1901},
+    "NL": {"suffix": "n", "name": "National League", "first_year": 1876},
+}
+LAST_YEAR = 2024
+
+def league_csv_paths(league, data_dir="../data"):
+    # e.g. ../data/american_league_stats_1901_2024.csv
+    info = LEAGUES[league]
+    prefix = f"{data_dir}/{info['name'].lower().replace(' ', '_')}"
+    years = f"{info['first_year']}_{LAST_YEAR}"
+    return {
+        "hitting": f"{prefix}_stats_{years}.csv",
+        "pitching": f"{prefix}_pitcher_stats_{years}.csv",
+    }
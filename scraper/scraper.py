@@ -6,6 +6,7 @@ from selenium.webdriver.support import expected_conditions as EC
 import csv
 import time
 import os
+from leagues import LEAGUES, LAST_YEAR, league_csv_paths
 
 def create_driver():
     chrome_options = Options()
@@ -17,7 +18,7 @@ def create_driver():
     # chrome_options.add_argument("--headless")
     return webdriver.Chrome(options=chrome_options)
 
-def parse_player_review(driver, url, target_year):
+def parse_player_review(driver, url, target_year, league_name="American League"):
     driver.get(url)
     WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "tbody")))
     results = []
@@ -30,7 +31,7 @@ def parse_player_review(driver, url, target_year):
         if not h2s:
             continue
         h2_text = h2s[0].text.strip()
-        if str(target_year) in h2_text and "American League Player Review" in h2_text:
+        if str(target_year) in h2_text and f"{league_name} Player Review" in h2_text:
             for row in tbody.find_elements(By.TAG_NAME, "tr"):
                 if row.find_elements(By.CSS_SELECTOR, "td.banner, td.headerBlue, td.header"):
                     continue
@@ -45,7 +46,7 @@ def parse_player_review(driver, url, target_year):
             break
     return results
 
-def parse_pitcher_review(driver, url, target_year):
+def parse_pitcher_review(driver, url, target_year, league_name="American League"):
     driver.get(url)
     WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "tbody")))
     results = []
@@ -58,7 +59,7 @@ def parse_pitcher_review(driver, url, target_year):
         if not h2s:
             continue
         h2_text = h2s[0].text.strip()
-        if str(target_year) in h2_text and "American League Pitcher Review" in h2_text:
+        if str(target_year) in h2_text and f"{league_name} Pitcher Review" in h2_text:
             rows = tbody.find_elements(By.TAG_NAME, "tr")
             current_category = None
             current_value = None
@@ -83,46 +84,51 @@ def parse_pitcher_review(driver, url, target_year):
             break
     return results
 
-def main():
-    os.makedirs("../data", exist_ok=True)
-    base_url = "https://www.baseball-almanac.com/yearly/yr{year}a.shtml"
+def save_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Year", "Event", "Player", "Team", "Value"])
+        writer.writerows(rows)
+
+def scrape_league(driver, league):
+    info = LEAGUES[league]
+    base_url = "https://www.baseball-almanac.com/yearly/yr{year}" + info["suffix"] + ".shtml"
     all_player_data = []
     all_pitcher_data = []
 
-    driver = create_driver()
-
-    for year in range(1901, 2025):
+    for year in range(info["first_year"], LAST_YEAR + 1):
         url = base_url.format(year=year)
-        print(f"\nParsing year {year}...")
+        print(f"\nParsing {league} year {year}...")
         try:
-            player_data = parse_player_review(driver, url, year)
+            player_data = parse_player_review(driver, url, year, info["name"])
             if player_data:
                 print(f"  ✅ Player stats found for {year}: {len(player_data)} rows")
                 all_player_data.extend(player_data)
             else:
                 print(f"  ⚠️ No player data for {year}")
 
-            pitcher_data = parse_pitcher_review(driver, url, year)
+            pitcher_data = parse_pitcher_review(driver, url, year, info["name"])
             if pitcher_data:
                 print(f"  ✅ Pitcher stats found for {year}: {len(pitcher_data)} rows")
                 all_pitcher_data.extend(pitcher_data)
             else:
                 print(f"  ⚠️ No pitcher data for {year}")
         except Exception as e:
-            print(f"  ❌ Error processing {year}: {e}")
+            print(f"  ❌ Error processing {league} {year}: {e}")
         time.sleep(2)
 
-    driver.quit()
+    csv_paths = league_csv_paths(league)
+    save_csv(csv_paths["hitting"], all_player_data)
+    save_csv(csv_paths["pitching"], all_pitcher_data)
 
-    with open("../data/american_league_stats_1901_2024.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Year", "Event", "Player", "Team", "Value"])
-        writer.writerows(all_player_data)
+def main():
+    os.makedirs("../data", exist_ok=True)
+    driver = create_driver()
 
-    with open("../data/american_league_pitcher_stats_1901_2024.csv", "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Year", "Event", "Player", "Team", "Value"])
-        writer.writerows(all_pitcher_data)
+    for league in LEAGUES:
+        scrape_league(driver, league)
+
+    driver.quit()
 
     print("\n✅ All data saved successfully!")
 